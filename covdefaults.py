@@ -17,13 +17,15 @@ _ALL = (
     # sys.implementation.name
     'cpython', 'pypy',
 )
+_CURRENT_TAGS = frozenset((os.name, sys.platform, sys.implementation.name))
+_OTHER_TAGS = tuple(tag for tag in _ALL if tag not in _CURRENT_TAGS)
 
 
-def _plat_impl_pragmas() -> list[str]:
-    tags = {os.name, sys.platform, sys.implementation.name}
-    ret = [fr'# pragma: {tag} cover\b' for tag in _ALL if tag not in tags]
-    ret.extend(fr'# pragma: {tag} no cover\b' for tag in tags)
-    return ret
+def _plat_impl_pragmas() -> tuple[str, ...]:
+    return (
+        *(fr'# pragma: {tag} cover\b' for tag in _OTHER_TAGS),
+        *(fr'# pragma: {tag} no cover\b' for tag in _CURRENT_TAGS),
+    )
 
 
 def _lt(n: int) -> str:
@@ -115,32 +117,28 @@ EXTEND = (
         ],
     ),
 )
+_EXTEND_SETS = tuple((k, frozenset(v)) for k, v in EXTEND)
+_DEFAULT_EXCLUDE_FS = frozenset(DEFAULT_EXCLUDE)
 
 
 class CovDefaults(CoveragePlugin):
     def __init__(self, subtract_omit: str = '') -> None:
-        self._subtract_omit = subtract_omit.split()
+        self._subtract_omit = frozenset(subtract_omit.split())
 
     def configure(self, config: CoverageConfig) -> None:
         for k, v in OPTIONS:
             config.set_option(k, v)
         if config.get_option('run:source') is None:
             config.set_option('run:source', ['.'])
-        for k, v in EXTEND:
-            before = set(config.get_option(k) or ())
-            before.update(v)
-            config.set_option(k, sorted(before))
-
-        # subtract omit settings if requested
-        if self._subtract_omit:
-            omit = set(config.get_option('run:omit'))
-            omit.difference_update(self._subtract_omit)
-            config.set_option('run:omit', sorted(omit))
-
-        # remove DEFAULT_EXCLUDE, we add a more-strict casing
-        exclude = set(config.get_option('report:exclude_lines'))
-        exclude.difference_update(DEFAULT_EXCLUDE)
-        config.set_option('report:exclude_lines', sorted(exclude))
+        for k, v in _EXTEND_SETS:
+            value = v.union(config.get_option(k) or ())
+            # subtract omit settings if requested
+            if k == 'run:omit':
+                value -= self._subtract_omit
+            # remove DEFAULT_EXCLUDE, we add a more-strict casing
+            elif k == 'report:exclude_lines':
+                value -= _DEFAULT_EXCLUDE_FS
+            config.set_option(k, sorted(value))
 
         # fail_under: if they specify a value then honor it
         if not config.get_option('report:fail_under'):
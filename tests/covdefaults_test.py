@@ -3,6 +3,7 @@ from __future__ import annotations
 import importlib
 import re
 
+import coverage
 import pytest
 from coverage.config import CoverageConfig
 from coverage.config import DEFAULT_EXCLUDE
@@ -14,16 +15,16 @@ configure = covdefaults.CovDefaults().configure
 
 
 def test_plat_impl_pragmas():
-    pragmas = covdefaults._plat_impl_pragmas()
-    assert {p.split()[2] for p in pragmas} == set(covdefaults._ALL)
+    parts = [p.split() for p in covdefaults._plat_impl_pragmas()]
+    assert {t[2] for t in parts} == set(covdefaults._ALL)
     # other pragmas
-    for s in pragmas[:-3]:
-        c, pragma, _, cover = s.split()
-        assert (c, pragma, cover) == ('#', 'pragma:', r'cover\b'), s
+    for t in parts[:-3]:
+        c, pragma, _, cover = t
+        assert (c, pragma, cover) == ('#', 'pragma:', r'cover\b'), t
     # self pragmas
-    for s in pragmas[-3:]:
-        c, pragma, _, no, cover = s.split()
-        assert (c, pragma, no, cover) == ('#', 'pragma:', 'no', r'cover\b'), s
+    for t in parts[-3:]:
+        c, pragma, _, no, cover = t
+        assert (c, pragma, no, cover) == ('#', 'pragma:', 'no', r'cover\b'), t
 
 
 def _matches_version_pragma(major, minor, s):
@@ -109,13 +110,25 @@ def test_version_pragmas_py310(s, expected):
     assert _matches_version_pragma(3, 10, s) == expected
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def configured():
     cfg = CoverageConfig()
     configure(cfg)
     return cfg
 
 
+@pytest.fixture(scope='module')
+def exclude_union(configured):
+    regs = configured.get_option('report:exclude_lines')
+    return re.compile('|'.join(f'(?:{reg})' for reg in regs))
+
+
+@pytest.fixture(scope='module')
+def plugin_manager():
+    cfg = CoverageConfig()
+    return Plugins.load_plugins(['covdefaults'], cfg)
+
+
 def test_constant_options(configured):
     assert configured.get_option('run:branch') is True
     assert configured.get_option('run:source') == ['.']
@@ -151,8 +164,8 @@ def test_subtract_omit():
 
 
 def test_exclude_lines_does_not_include_defaults(configured):
-    ret = set(configured.get_option('report:exclude_lines'))
-    assert set(DEFAULT_EXCLUDE) & ret == set()
+    ret = configured.get_option('report:exclude_lines')
+    assert set(DEFAULT_EXCLUDE).isdisjoint(ret)
 
 
 @pytest.mark.parametrize(
@@ -182,12 +195,9 @@ def test_exclude_lines_does_not_include_defaults(configured):
         "if __name__ == '__main__':\n",
     ),
 )
-def test_excludes_lines(configured, src):
-    for reg in configured.get_option('report:exclude_lines'):
-        if any(re.search(reg, line) for line in src.splitlines()):
-            break
-    else:
-        raise AssertionError(f'no regex matched {src!r}')
+def test_excludes_lines(exclude_union, src):
+    lines = src.splitlines()
+    assert any(exclude_union.search(line) for line in lines), src
 
 
 @pytest.mark.parametrize(
@@ -205,11 +215,9 @@ def test_excludes_lines(configured, src):
     ),
 )
 def test_partial_branches(configured, src):
-    for reg in configured.get_option('report:partial_branches'):
-        if any(re.search(reg, line) for line in src.splitlines()):
-            break
-    else:
-        raise AssertionError(f'no regex matched {src!r}')
+    lines = src.splitlines()
+    regs = configured.get_option('report:partial_branches')
+    assert any(re.search(reg, line) for reg in regs for line in lines), src
 
 
 def test_extends_existing_exclude_lines():
@@ -226,12 +234,30 @@ def test_configure_keeps_existing_fail_under():
     assert cfg.get_option('report:fail_under') == 42
 
 
-def test_coverage_init():
+def test_configure_is_idempotent():
     cfg = CoverageConfig()
-    plugin_manager = Plugins.load_plugins(['covdefaults'], cfg)
+    configure(cfg)
+    before = {
+        k: cfg.get_option(k)
+        for k in ('run:omit', 'run:source', 'report:exclude_lines')
+    }
+    configure(cfg)
+    after = {k: cfg.get_option(k) for k in before}
+    assert after == before
+
+
+def test_coverage_init(plugin_manager):
     assert plugin_manager.get('covdefaults.CovDefaults')
 
 
+@pytest.mark.skipif(
+    coverage.Coverage.current() is None,
+    reason='only needed when coverage is measuring this run',
+)
 def test_fix_coverage():
-    """since we get imported as a coverage plugin -- need to re-scan module"""
+    """since we get imported as a coverage plugin -- need to re-scan module
+
+    only runs under `coverage run` / pytest-cov: without an active coverage
+    instance there is nothing to re-scan, so plain `pytest` reports a skip
+    """
     importlib.reload(covdefaults)